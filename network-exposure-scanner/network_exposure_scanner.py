@@ -12,14 +12,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import errno
+import html
 import ipaddress
+import itertools
 import json
+import multiprocessing
 import os
+import socket
+import string
+import struct
 import sys
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterable, Iterator, List, Sequence, TypeVar
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+T = TypeVar("T")
 
 
 DEFAULT_PORTS = [
@@ -46,8 +60,40 @@ RISK_NOTES = {
     8080: "Check for admin consoles left exposed.",
 }
 
+_HTTP_PROBE = b"GET / HTTP/1.0\r\n\r\n"
+
+# What to send after connecting, per port. b"" means the server speaks first
+# so we only read; None means the protocol is binary/TLS and a read would just
+# sit out the timeout, so the open port is recorded without a banner. Ports
+# not listed get a bare newline to coax a banner.
+PROBES: dict[int, bytes | None] = {
+    21: b"",
+    22: b"",
+    23: b"",
+    25: b"",
+    80: _HTTP_PROBE,
+    110: b"",
+    135: None,
+    139: None,
+    143: b"",
+    443: None,
+    445: None,
+    465: None,
+    587: b"",
+    993: None,
+    995: None,
+    1433: None,
+    3306: b"",
+    3389: None,
+    5900: b"",
+    6379: b"PING\r\n",
+    8080: _HTTP_PROBE,
+    8443: None,
+}
+_DEFAULT_PROBE = b"\n"
+
 
-@dataclass
+@dataclass(slots=True)
 class Exposure:
     host: str
     port: int
@@ -55,7 +101,7 @@ class Exposure:
     risk: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanReport:
     target: str
     ports: Sequence[int]
@@ -65,50 +111,122 @@ class ScanReport:
     finished_at: str
 
     def to_json(self) -> str:
-        return json.dumps(
-            {
-                "target": self.target,
-                "ports": list(self.ports),
-                "host_count": self.host_count,
-                "started_at": self.started_at,
-                "finished_at": self.finished_at,
-                "exposures": [asdict(exp) for exp in self.exposures],
-            },
-            indent=2,
-        )
+        # Build plain dicts by hand; asdict() reflects over every field of
+        # every exposure, which dominates on large scans.
+        payload = {
+            "target": self.target,
+            "ports": list(self.ports),
+            "host_count": self.host_count,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "exposures": [
+                {
+                    "host": exp.host,
+                    "port": exp.port,
+                    "service_banner": exp.service_banner,
+                    "risk": exp.risk,
+                }
+                for exp in self.exposures
+            ],
+        }
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(payload, indent=2)
+
+
+_PACK_IPV4 = struct.Struct(">I").pack
+
+
+def _host_bounds(net: ipaddress.IPv4Network | ipaddress.IPv6Network) -> tuple[int, int]:
+    """Return the ``[first, stop)`` integer range covered by ``net.hosts()``."""
+    base = int(net.network_address)
+    total = net.num_addresses
+    if total <= 2:
+        # /31, /32, /127 and /128 have no reserved addresses.
+        return base, base + total
+    # IPv4 drops network + broadcast; IPv6 only the subnet-router anycast.
+    return base + 1, base + total - (1 if net.version == 4 else 0)
+
+
+def _iter_host_range(version: int, first: int, stop: int) -> Iterator[str]:
+    if version != 4:
+        for value in range(first, stop):
+            yield str(ipaddress.IPv6Address(value))
+        return
+    ntoa = socket.inet_ntoa
+    for value in range(first, stop):
+        yield ntoa(_PACK_IPV4(value))
+
+
+def host_count(net: ipaddress.IPv4Network | ipaddress.IPv6Network) -> int:
+    """Return ``len(list(net.hosts()))`` without walking the network."""
+    first, stop = _host_bounds(net)
+    return stop - first
+
+
+def iter_hosts(net: ipaddress.IPv4Network | ipaddress.IPv6Network) -> Iterator[str]:
+    """Yield the same addresses as ``net.hosts()`` but as plain strings.
+
+    For IPv4 this counts over integers and formats each address on demand,
+    skipping the IPv4Address object per host that ``hosts()`` would build.
+    """
+    return _iter_host_range(net.version, *_host_bounds(net))
 
 
 async def scan_port(
+    loop: asyncio.AbstractEventLoop,
     ip: str,
     port: int,
     timeout: float,
-    semaphore: asyncio.Semaphore,
+    semaphore: asyncio.BoundedSemaphore,
 ) -> Exposure | None:
-    """Attempt to connect to ip:port and capture a short banner."""
+    """Attempt to connect to ip:port and capture a short banner.
+
+    Uses a bare non-blocking socket with the loop's ``sock_*`` helpers rather
+    than ``asyncio.open_connection`` so each probe avoids building a
+    transport/protocol/stream pair it only uses for a single read.
+
+    ``semaphore`` is held for the socket's whole lifetime, so no more than
+    ``--concurrency`` descriptors are ever open at once.
+    """
+    probe = PROBES.get(port, _DEFAULT_PROBE)
+    banner = b""
     try:
+        family = socket.AF_INET6 if ":" in ip else socket.AF_INET
         async with semaphore:
-            reader: asyncio.StreamReader
-            writer: asyncio.StreamWriter
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(ip, port),
-                timeout=timeout,
-            )
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setblocking(False)
             try:
-                await asyncio.wait_for(writer.drain(), timeout=timeout)
-                # Send a newline to coax banners for some protocols.
-                writer.write(b"\n")
-                await asyncio.wait_for(writer.drain(), timeout=timeout)
-                try:
-                    banner = await asyncio.wait_for(reader.read(64), timeout=timeout)
-                except TimeoutError:
-                    banner = b""
+                await asyncio.wait_for(loop.sock_connect(sock, (ip, port)), timeout=timeout)
+                if probe is not None:
+                    if probe:
+                        try:
+                            sock.send(probe)
+                        except BlockingIOError:
+                            pass
+                    # HTTP needs a bit more room to get a whole status line.
+                    size = 256 if probe == _HTTP_PROBE else 64
+                    try:
+                        banner = await asyncio.wait_for(loop.sock_recv(sock, size), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
             finally:
-                writer.close()
-                await writer.wait_closed()
-    except (asyncio.TimeoutError, ConnectionError, OSError):
+                sock.close()
+    except (asyncio.TimeoutError, ConnectionError, OSError) as exc:
+        if getattr(exc, "errno", None) in (errno.EMFILE, errno.ENFILE):
+            # Out of descriptors says nothing about the port; don't report
+            # it as closed.
+            raise RuntimeError(
+                f"Ran out of file descriptors ({exc.strerror}); lower --concurrency"
+                " or raise the open-file limit (ulimit -n)."
+            ) from exc
         return None
 
-    banner_text = banner.decode(errors="ignore").strip() if banner else None
+    # latin-1 maps every byte straight to a code point, so it never hits the
+    # error-handler path; banners are ASCII in practice.
+    banner_text = banner.decode("latin-1").strip() if banner else None
+    if banner_text and probe == _HTTP_PROBE:
+        banner_text = banner_text.splitlines()[0]
     return Exposure(
         host=ip,
         port=port,
@@ -122,77 +240,245 @@ async def scan_network(
     ports: Sequence[int],
     timeout: float,
     concurrency: int,
+) -> AsyncIterator[Exposure]:
+    """Yield exposures for every host in ``target_cidr`` as probes finish."""
+    net = ipaddress.ip_network(target_cidr, strict=False)
+    async for exp in scan_hosts(iter_hosts(net), ports, timeout, concurrency):
+        yield exp
+
+
+def _finished(
+    done: Iterable[asyncio.Task[Exposure | None]], reraise: bool = True
 ) -> List[Exposure]:
+    """Collect exposures from finished probe tasks.
+
+    Every task's exception is retrieved first so that one fatal error doesn't
+    leave the rest of the batch logging "Task exception was never retrieved".
+    """
+    errors = [task.exception() for task in done if not task.cancelled()]
+    first_error = next((exc for exc in errors if exc is not None), None)
+    if first_error is not None:
+        if reraise:
+            raise first_error
+        return []
+    return [result for task in done if not task.cancelled() and (result := task.result())]
+
+
+async def scan_hosts(
+    hosts: Iterable[str],
+    ports: Sequence[int],
+    timeout: float,
+    concurrency: int,
+) -> AsyncIterator[Exposure]:
+    """Yield exposures as probes finish, with at most ``concurrency`` sockets open.
+
+    Tasks are created lazily from the (ip, port) stream instead of all up
+    front, so memory stays proportional to ``concurrency`` rather than to
+    hosts × ports.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.BoundedSemaphore(max(1, concurrency))
+    # Keep a few probes queued on the semaphore so a freed slot is reused
+    # immediately instead of waiting for the producer loop.
+    limit = max(1, concurrency) * 2
+    inflight: set[asyncio.Task[Exposure | None]] = set()
+    try:
+        for ip in hosts:
+            for port in ports:
+                if len(inflight) >= limit:
+                    done, inflight = await asyncio.wait(
+                        inflight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for result in _finished(done):
+                        yield result
+                inflight.add(loop.create_task(scan_port(loop, ip, port, timeout, semaphore)))
+        while inflight:
+            done, inflight = await asyncio.wait(
+                inflight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for result in _finished(done):
+                yield result
+    finally:
+        for task in inflight:
+            task.cancel()
+        if inflight:
+            # Reap the cancelled probes so their sockets are closed and any
+            # failures they hit are not reported as "never retrieved".
+            await asyncio.wait(inflight)
+            _finished(inflight, reraise=False)
+
+
+async def collect_exposures(exposures: AsyncIterator[Exposure]) -> List[Exposure]:
+    """Drain an exposure stream (e.g. from scan_network) into a list."""
+    return [exp async for exp in exposures]
+
+
+EVENT_LOOPS = ("asyncio", "rloop")
+
+
+def _loop_factory(event_loop: str) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return a loop factory for ``event_loop``; None means asyncio's default.
+
+    ``rloop`` is an experimental Rust selector loop (mio/epoll, not io_uring)
+    and is only used when asked for explicitly.
+    """
+    if event_loop == "rloop":
+        import rloop  # type: ignore[import-not-found]
+
+        return rloop.new_event_loop
+    return None
+
+
+def run_async(main: Coroutine[Any, Any, T], event_loop: str = "asyncio") -> T:
+    """Like ``asyncio.run``, but on the event loop named by ``event_loop``."""
+    factory = _loop_factory(event_loop)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=factory) as runner:
+            return runner.run(main)
+    if factory is None:
+        return asyncio.run(main)
+    # Python 3.10 has no Runner: mirror asyncio.run's shutdown sequence so
+    # leftover tasks and async generators are cancelled before closing.
+    loop = factory()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+def _scan_shard(args: tuple[int, int, int, Sequence[int], float, int, str]) -> List[Exposure]:
+    """Pool entry point: scan one contiguous slice of the host range."""
+    version, first, stop, ports, timeout, concurrency, event_loop = args
+    hosts = _iter_host_range(version, first, stop)
+    return run_async(
+        collect_exposures(scan_hosts(hosts, ports, timeout, concurrency)), event_loop
+    )
+
+
+def scan_network_sharded(
+    target_cidr: str,
+    ports: Sequence[int],
+    timeout: float,
+    concurrency: int,
+    workers: int,
+    event_loop: str = "asyncio",
+) -> List[Exposure]:
+    """Split the host range across ``workers`` processes, one event loop each.
+
+    ``concurrency`` stays a global cap: each worker gets an equal share, and
+    ``workers`` is clamped so no worker is left with less than one slot.
+    """
     net = ipaddress.ip_network(target_cidr, strict=False)
-    ips = [str(host) for host in net.hosts()]
-    semaphore = asyncio.Semaphore(concurrency)
-    tasks: list[asyncio.Task[Exposure | None]] = []
-    for ip in ips:
-        for port in ports:
-            tasks.append(asyncio.create_task(scan_port(ip, port, timeout, semaphore)))
-    exposures: List[Exposure] = []
-    for task in asyncio.as_completed(tasks):
-        result = await task
-        if result:
-            exposures.append(result)
-    return exposures
+    first, stop = _host_bounds(net)
+    workers = max(1, min(workers, concurrency, stop - first))
+    step = -(-(stop - first) // workers)
+    bounds = [(lo, min(lo + step, stop)) for lo in range(first, stop, step)]
+    # Ceil-divided slices can yield fewer shards than workers; share the
+    # concurrency out over the shards that actually exist.
+    per_worker = max(1, concurrency // len(bounds))
+    shards = [
+        (net.version, lo, hi, list(ports), timeout, per_worker, event_loop)
+        for lo, hi in bounds
+    ]
+    # spawn avoids inheriting threads (e.g. Tk) through fork.
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(len(shards)) as pool:
+        results = pool.map(_scan_shard, shards)
+    return [exp for shard in results for exp in shard]
 
 
 def parse_ports(raw: str | None) -> List[int]:
     if not raw:
         return DEFAULT_PORTS
-    ports: List[int] = []
+    # One flag byte per port number: range chunks are slice assignments and
+    # the result comes out sorted and de-duplicated without a set.
+    mask = bytearray(65536)
     for chunk in raw.split(","):
         chunk = chunk.strip()
         if not chunk:
             continue
         if "-" in chunk:
             start_s, end_s = chunk.split("-", 1)
-            start, end = int(start_s), int(end_s)
-            ports.extend(range(start, end + 1))
+            start, end = max(int(start_s), 1), min(int(end_s), 65535)
         else:
-            ports.append(int(chunk))
-    return sorted(set(port for port in ports if 1 <= port <= 65535))
+            start = end = int(chunk)
+            if not 1 <= start <= 65535:
+                continue
+        if start <= end:
+            mask[start:end + 1] = b"\x01" * (end - start + 1)
+    return list(itertools.compress(range(65536), mask))
 
 
-def write_html(report: ScanReport, output_path: Path) -> None:
-    rows = []
-    for exp in report.exposures:
-        rows.append(
-            f"<tr><td>{exp.host}</td><td>{exp.port}</td><td>{exp.service_banner or '-'}" \
-            f"</td><td>{exp.risk or 'Review manually'}</td></tr>"
-        )
-    table_rows = "\n".join(rows) or "<tr><td colspan='4'>No exposures detected</td></tr>"
-    html = f"""<!doctype html>
-<html lang=\"en\">
+# Parsed once at import; only the scan-specific fields vary per report.
+_HTML_HEADER = string.Template("""<!doctype html>
+<html lang="en">
 <head>
-  <meta charset=\"utf-8\">
+  <meta charset="utf-8">
   <title>Network Exposure Report</title>
   <style>
-    body {{ font-family: -apple-system, 'Segoe UI', sans-serif; margin: 2rem; }}
-    table {{ border-collapse: collapse; width: 100%; }}
-    th, td {{ border: 1px solid #ddd; padding: 0.5rem; }}
-    th {{ background: #f3f4f6; text-align: left; }}
+    body { font-family: -apple-system, 'Segoe UI', sans-serif; margin: 2rem; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ddd; padding: 0.5rem; }
+    th { background: #f3f4f6; text-align: left; }
   </style>
 </head>
 <body>
   <h1>Network Exposure Report</h1>
-  <p><strong>Target:</strong> {report.target}</p>
-  <p><strong>Hosts scanned:</strong> {report.host_count}</p>
-  <p><strong>Ports:</strong> {', '.join(map(str, report.ports))}</p>
-  <p><strong>Scan window:</strong> {report.started_at} → {report.finished_at}</p>
+  <p><strong>Target:</strong> $target</p>
+  <p><strong>Hosts scanned:</strong> $host_count</p>
+  <p><strong>Ports:</strong> $ports</p>
+  <p><strong>Scan window:</strong> $started_at → $finished_at</p>
   <table>
     <thead>
       <tr><th>Host</th><th>Port</th><th>Banner</th><th>Risk Note</th></tr>
     </thead>
     <tbody>
-      {table_rows}
-    </tbody>
+      """)
+_ROW = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>\n".format
+_EMPTY_ROW = "<tr><td colspan='4'>No exposures detected</td></tr>\n"
+_HTML_FOOTER = """    </tbody>
   </table>
 </body>
 </html>
 """
-    output_path.write_text(html, encoding="utf-8")
+
+
+def write_html(report: ScanReport, output_path: Path) -> None:
+    header = _HTML_HEADER.substitute(
+        target=html.escape(report.target),
+        host_count=report.host_count,
+        ports=", ".join(map(str, report.ports)),
+        started_at=report.started_at,
+        finished_at=report.finished_at,
+    )
+    # Rows are streamed through the buffered file one at a time, so the full
+    # document never exists as a single string in memory.
+    with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.write(header)
+        if report.exposures:
+            # Banners come straight off the wire, so they must be escaped.
+            fh.writelines(
+                _ROW(
+                    exp.host,
+                    exp.port,
+                    html.escape(exp.service_banner or "-"),
+                    html.escape(exp.risk or "Review manually"),
+                )
+                for exp in report.exposures
+            )
+        else:
+            fh.write(_EMPTY_ROW)
+        fh.write(_HTML_FOOTER)
 
 
 def run_cli() -> None:
@@ -215,7 +501,29 @@ def run_cli() -> None:
         "--concurrency",
         type=int,
         default=200,
-        help="Maximum simultaneous connection attempts (default: 200).",
+        help="Maximum simultaneous open sockets (default: 200); in syn mode,"
+             " maximum unanswered SYNs at once.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes to shard a connect scan across; concurrency is split"
+             " between them (default: 1).",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("connect", "syn"),
+        default="connect",
+        help="Probe style: full TCP connect with banner grab (default) or"
+             " half-open SYN scan (IPv4, needs root; no banners).",
+    )
+    parser.add_argument(
+        "--event-loop",
+        choices=EVENT_LOOPS,
+        default="asyncio",
+        help="Event loop implementation (default: asyncio). 'rloop' is an"
+             " experimental Rust selector loop and must be installed separately.",
     )
     parser.add_argument(
         "--json",
@@ -232,21 +540,57 @@ def run_cli() -> None:
     ports = parse_ports(args.ports)
     if not ports:
         parser.error("No valid ports supplied.")
+    try:
+        net = ipaddress.ip_network(args.target, strict=False)
+    except ValueError as exc:
+        parser.error(f"Invalid CIDR: {exc}")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1.")
+    if args.event_loop == "rloop":
+        try:
+            import rloop  # type: ignore[import-not-found]  # noqa: F401
+        except ImportError:
+            parser.error("--event-loop rloop requested but rloop is not installed.")
+
+    scanner = scan_network
+    if args.mode == "syn":
+        import syn_scanner
+
+        if net.version != 4:
+            print("SYN mode only supports IPv4; falling back to connect scan.", file=sys.stderr)
+        elif not syn_scanner.has_raw_socket_access():
+            print("SYN mode needs raw socket privileges; falling back to connect scan.", file=sys.stderr)
+        else:
+            scanner = syn_scanner.syn_scan_network
+            if args.workers > 1:
+                print("--workers is ignored in SYN mode; it uses a single raw socket.", file=sys.stderr)
 
     start = datetime.utcnow()
     try:
-        exposures = asyncio.run(
-            scan_network(args.target, ports, args.timeout, args.concurrency)
-        )
+        if scanner is scan_network and args.workers > 1:
+            exposures = scan_network_sharded(
+                args.target, ports, args.timeout, args.concurrency, args.workers,
+                args.event_loop,
+            )
+        else:
+            exposures = run_async(
+                collect_exposures(
+                    scanner(args.target, ports, args.timeout, args.concurrency)
+                ),
+                args.event_loop,
+            )
     except KeyboardInterrupt:
         print("Scan interrupted by user.")
         sys.exit(1)
+    except RuntimeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
     stop = datetime.utcnow()
 
     report = ScanReport(
         target=args.target,
         ports=ports,
-        host_count=sum(1 for _ in ipaddress.ip_network(args.target, strict=False).hosts()),
+        host_count=host_count(net),
         exposures=exposures,
         started_at=start.isoformat() + "Z",
         finished_at=stop.isoformat() + "Z",
@@ -9,10 +9,10 @@ Lets the user:
 """
 from __future__ import annotations
 
-import asyncio
 import ipaddress
 import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from tkinter import messagebox, scrolledtext
 from pathlib import Path
@@ -30,6 +30,8 @@ class ScannerGUI(tk.Tk):
         self._build_form()
         self._build_log()
         self._scan_thread: threading.Thread | None = None
+        # Writes the JSON and HTML reports side by side after each scan.
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
 
     def _build_form(self) -> None:
         frame = tk.Frame(self)
@@ -123,25 +125,29 @@ class ScannerGUI(tk.Tk):
         self.log.delete("1.0", "end")
         self.log.configure(state="disabled")
 
+        host_count = core.host_count(ip_net)
+
         self.scan_btn.config(state="disabled")
         self.log_line(f"Starting scan of {target} at {datetime.utcnow().isoformat()}Z")
-        self.log_line(f"Hosts: {sum(1 for _ in ip_net.hosts())}, Ports: {', '.join(map(str, ports))}")
+        self.log_line(f"Hosts: {host_count}, Ports: {', '.join(map(str, ports))}")
 
         def worker() -> None:
             try:
-                exposures = asyncio.run(
-                    core.scan_network(str(ip_net), ports, timeout, concurrency)
+                start = datetime.utcnow()
+                exposures = core.run_async(
+                    core.collect_exposures(
+                        core.scan_network(str(ip_net), ports, timeout, concurrency)
+                    )
                 )
+                stop = datetime.utcnow()
                 report = core.ScanReport(
                     target=str(ip_net),
                     ports=ports,
-                    host_count=sum(1 for _ in ip_net.hosts()),
+                    host_count=host_count,
                     exposures=exposures,
-                    started_at=datetime.utcnow().isoformat() + "Z",
-                    finished_at=datetime.utcnow().isoformat() + "Z",
+                    started_at=start.isoformat() + "Z",
+                    finished_at=stop.isoformat() + "Z",
                 )
-                json_path.write_text(report.to_json(), encoding="utf-8")
-                core.write_html(report, html_path)
 
                 def done() -> None:
                     self.log_line("Scan complete.")
@@ -154,15 +160,32 @@ class ScannerGUI(tk.Tk):
                                 self.log_line(f"   Risk: {exp.risk}")
                     else:
                         self.log_line("No exposed services detected on the selected ports.")
+
+                # Show results right away; the reports are written meanwhile.
+                self.after(0, done)
+                writes = [
+                    self._io_pool.submit(
+                        lambda: json_path.write_text(report.to_json(), encoding="utf-8")
+                    ),
+                    self._io_pool.submit(core.write_html, report, html_path),
+                ]
+                for future in writes:
+                    future.result()
+
+                def written() -> None:
                     self.log_line(f"JSON report: {json_path.resolve()}")
                     self.log_line(f"HTML report: {html_path.resolve()}")
                     self.scan_btn.config(state="normal")
 
-                self.after(0, done)
+                self.after(0, written)
             except Exception as exc:  # noqa: BLE001
+                # `exc` is unbound once this block exits, before Tk runs
+                # the callback, so capture the message now.
+                msg = str(exc)
+
                 def failed() -> None:
-                    self.log_line(f"Error: {exc}")
-                    messagebox.showerror("Scan failed", str(exc))
+                    self.log_line(f"Error: {msg}")
+                    messagebox.showerror("Scan failed", msg)
                     self.scan_btn.config(state="normal")
 
                 self.after(0, failed)
@@ -0,0 +1,188 @@
+"""Half-open (TCP SYN) scanning for network_exposure_scanner.
+
+Instead of completing a handshake per port, a single raw socket fires SYN
+segments and one reader task collects the SYN-ACK/RST replies. Answered
+probes free their slot immediately and none of them ties up a socket, so
+scans need no per-port descriptor and only unanswered probes wait out the
+timeout.
+
+Requires raw socket privileges (root / CAP_NET_RAW) and IPv4. No banners are
+captured because the handshake is never completed; the kernel answers each
+SYN-ACK with an RST on our behalf.
+"""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import random
+import socket
+import struct
+from typing import AsyncIterator, Sequence
+
+from network_exposure_scanner import RISK_NOTES, Exposure, iter_hosts
+
+_TCP_HEADER = struct.Struct("!HHIIHHHH")
+_PSEUDO_HEADER = struct.Struct("!4s4sBBH")
+_TCP_PREFIX = struct.Struct("!HHII")
+
+_FLAG_SYN = 0x02
+_FLAG_RST = 0x04
+_FLAG_ACK = 0x10
+_WINDOW = 1024
+_RECV_BUFFER = 4 << 20
+
+
+def has_raw_socket_access() -> bool:
+    """Return True if this process may open a raw TCP socket."""
+    try:
+        socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP).close()
+    except (PermissionError, OSError, AttributeError):
+        return False
+    return True
+
+
+def _source_address(dest_ip: str) -> str:
+    """Ask the routing table which local address reaches ``dest_ip``."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        # UDP connect() sends nothing; it only selects a route.
+        probe.connect((dest_ip, 9))
+        return probe.getsockname()[0]
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _syn_segment(src: bytes, dst: bytes, sport: int, dport: int, seq: int) -> bytes:
+    """Build a 20-byte TCP SYN header; the kernel supplies the IP header."""
+    offset_flags = (5 << 12) | _FLAG_SYN
+    header = _TCP_HEADER.pack(sport, dport, seq, 0, offset_flags, _WINDOW, 0, 0)
+    pseudo = _PSEUDO_HEADER.pack(src, dst, 0, socket.IPPROTO_TCP, len(header))
+    checksum = _checksum(pseudo + header)
+    return header[:16] + struct.pack("!H", checksum) + header[18:]
+
+
+async def syn_scan_network(
+    target_cidr: str,
+    ports: Sequence[int],
+    timeout: float,
+    concurrency: int,
+) -> AsyncIterator[Exposure]:
+    """Yield exposures for ports that answer a SYN with SYN-ACK.
+
+    At most ``concurrency`` probes are outstanding at once, mirroring a
+    connect scan's open-socket cap: a probe's slot frees as soon as it is
+    answered (SYN-ACK or RST), and only unanswered probes wait out
+    ``timeout``.
+
+    Destinations that can't be routed or sent to are skipped, just as connect
+    mode reports them as not open.
+    """
+    net = ipaddress.ip_network(target_cidr, strict=False)
+    if net.version != 4:
+        raise ValueError("SYN mode only supports IPv4 targets.")
+
+    loop = asyncio.get_running_loop()
+    sport = random.randint(40000, 60999)
+    seq = random.getrandbits(32)
+    expected_ack = (seq + 1) & 0xFFFFFFFF
+    wanted_ports = frozenset(ports)
+    limit = max(1, concurrency)
+    found: asyncio.Queue[Exposure] = asyncio.Queue()
+    # (host, port) -> deadline. Probes are sent with the same timeout, so
+    # insertion order is deadline order and expiry pops from the front.
+    pending: dict[tuple[str, int], float] = {}
+    slot_freed = asyncio.Event()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+    try:
+        sock.setblocking(False)
+        # A raw TCP socket sees every inbound segment, not just our replies;
+        # a roomy buffer keeps bursts from dropping SYN-ACKs (false negatives).
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER)
+
+        async def receive() -> None:
+            seen: set[tuple[str, int]] = set()
+            while True:
+                packet = await loop.sock_recv(sock, 65535)
+                ihl = (packet[0] & 0x0F) * 4
+                if len(packet) < ihl + 14:
+                    continue
+                rport, dport, _, ack = _TCP_PREFIX.unpack_from(packet, ihl)
+                flags = packet[ihl + 13]
+                if dport != sport or ack != expected_ack or rport not in wanted_ports:
+                    continue
+                is_open = flags & (_FLAG_SYN | _FLAG_ACK) == _FLAG_SYN | _FLAG_ACK
+                if not is_open and not flags & _FLAG_RST:
+                    continue
+                key = (socket.inet_ntoa(packet[12:16]), rport)
+                if pending.pop(key, None) is not None:
+                    slot_freed.set()
+                if is_open and key not in seen:
+                    seen.add(key)
+                    found.put_nowait(
+                        Exposure(host=key[0], port=rport, service_banner=None, risk=RISK_NOTES.get(rport))
+                    )
+
+        receiver = asyncio.create_task(receive())
+
+        async def make_room(room: int) -> AsyncIterator[Exposure]:
+            """Yield replies until no more than ``room`` probes are outstanding."""
+            while True:
+                while not found.empty():
+                    yield found.get_nowait()
+                if receiver.done():
+                    # A dead reader would turn every open port into a miss.
+                    raise receiver.exception() or RuntimeError("SYN reply reader stopped.")
+                now = loop.time()
+                while pending and next(iter(pending.values())) <= now:
+                    del pending[next(iter(pending))]
+                if len(pending) <= room:
+                    return
+                slot_freed.clear()
+                try:
+                    await asyncio.wait_for(
+                        slot_freed.wait(), timeout=next(iter(pending.values())) - now
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        try:
+            src: bytes | None = None
+            for ip in iter_hosts(net):
+                try:
+                    if src is None:
+                        src = socket.inet_aton(_source_address(ip))
+                except OSError:
+                    continue  # no route to this host
+                dst = socket.inet_aton(ip)
+                for port in ports:
+                    async for exp in make_room(limit - 1):
+                        yield exp
+                    segment = _syn_segment(src, dst, sport, port, seq)
+                    try:
+                        while True:
+                            try:
+                                sock.sendto(segment, (ip, 0))
+                                break
+                            except BlockingIOError:
+                                await asyncio.sleep(0)
+                    except OSError:
+                        break  # unreachable / not permitted: skip this host
+                    pending[(ip, port)] = loop.time() + timeout
+                    if len(pending) % 32 == 0:
+                        # Let the reader drain the socket between bursts.
+                        await asyncio.sleep(0)
+
+            async for exp in make_room(0):
+                yield exp
+        finally:
+            receiver.cancel()
+            await asyncio.gather(receiver, return_exceptions=True)
+    finally:
+        sock.close()
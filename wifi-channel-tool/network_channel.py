@@ -2,15 +2,21 @@
 """Show the Wi-Fi channel for the currently connected network."""
 from __future__ import annotations
 
+import functools
+import os
 import platform
 import re
 import shutil
 import subprocess
 import sys
-from pathlib import Path
 from typing import Optional
 
 
+_AIRPORT_RE = re.compile(r"channel:\s*(.+)")
+_IWCONFIG_RE = re.compile(r"Channel[:=](\d+)")
+_SYSPROF_RE = re.compile(r"Channel:\s*(\d+)")
+
+
 def run_command(command: list[str]) -> str:
     """Run command and return stdout, raising a helpful error on failure."""
     try:
@@ -23,8 +29,14 @@ def run_command(command: list[str]) -> str:
         ) from exc
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Cached ``shutil.which``; tool locations don't change while we run."""
+    return shutil.which(name)
+
+
 def parse_channel_from_airport(output: str) -> Optional[str]:
-    match = re.search(r"channel:\s*(.+)", output)
+    match = _AIRPORT_RE.search(output)
     if match:
         # Some macOS versions show values like "149,1" → we only need the channel number
         return match.group(1).strip().split(",")[0]
@@ -41,16 +53,17 @@ def parse_channel_from_nmcli(output: str) -> Optional[str]:
 
 
 def parse_channel_from_iwconfig(output: str) -> Optional[str]:
-    match = re.search(r"Channel[:=](\d+)", output)
+    match = _IWCONFIG_RE.search(output)
     if match:
         return match.group(1)
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _find_airport_binary() -> Optional[str]:
     """Return a usable path to Apple's airport CLI if available."""
     candidates: list[str] = []
-    airport_in_path = shutil.which("airport")
+    airport_in_path = _which("airport")
     if airport_in_path:
         candidates.append(airport_in_path)
     candidates.extend(
@@ -61,7 +74,8 @@ def _find_airport_binary() -> Optional[str]:
     )
 
     for candidate in candidates:
-        if candidate and Path(candidate).exists():
+        # One access() call both confirms the file exists and is executable.
+        if os.access(candidate, os.X_OK):
             return candidate
     return None
 
@@ -73,7 +87,7 @@ def _get_channel_via_system_profiler() -> Optional[str]:
     except RuntimeError:
         return None
 
-    match = re.search(r"Channel:\s*(\d+)", output)
+    match = _SYSPROF_RE.search(output)
     if match:
         return match.group(1)
     return None
@@ -99,13 +113,13 @@ def get_channel() -> str:
         )
 
     if system == "linux":
-        nmcli = shutil.which("nmcli")
+        nmcli = _which("nmcli")
         if nmcli:
             output = run_command([nmcli, "-t", "-f", "active,chan", "dev", "wifi"])
             channel = parse_channel_from_nmcli(output)
             if channel:
                 return channel
-        iwconfig = shutil.which("iwconfig")
+        iwconfig = _which("iwconfig")
         if iwconfig:
             output = run_command([iwconfig])
             channel = parse_channel_from_iwconfig(output)